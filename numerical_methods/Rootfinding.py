@@ -1,10 +1,46 @@
 import numpy as np
 from prettytable import PrettyTable
-from typing import Callable
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Callable, Union
 
-resultados = PrettyTable(field_names=["i", "p", "f(p)"])
+from .DualNumbers import Dual
+
+# Numba is optional and slow to import, so it is only imported when a compiled kernel is first needed
+_HAS_NUMBA = find_spec("numba") is not None
+
+try:
+    from ._rootfinding import newton_c, secante_c, steffensen_c
+except ImportError:  # The Cython kernels are optional, the NumPy code below is used without them
+    newton_c = secante_c = steffensen_c = None
+
+try:
+    from .rootfinding_aot import newton_poly_f8
+except ImportError:  # Built ahead of time by build_rootfinding.py, optional as well
+    newton_poly_f8 = None
+
+_EPS = np.finfo(float).eps
+
+def _is_real_scalar(x) -> bool:
+    """True for a real 0-d input, the only kind the compiled scalar kernels accept."""
+    return np.ndim(x) == 0 and np.isrealobj(x)
+
+def _as_result(p: np.ndarray) -> Union[float, complex, np.ndarray]:
+    """Return 0-d results as a plain Python float (or complex), like the compiled kernels do."""
+    return p.item() if p.ndim == 0 else p
+
+def _sq(d: np.ndarray) -> np.ndarray:
+    """Squared magnitude of d without abs/sqrt, also correct for complex d."""
+    return (d * np.conjugate(d)).real if np.iscomplexobj(d) else d * d
+
+def _print_table(P: np.ndarray, F: np.ndarray, k: int) -> None:
+    """Print the first k recorded iterates and their function values as a table."""
+    resultados = PrettyTable(field_names=["i", "p", "f(p)"])  # Local, so concurrent calls never share rows
+    for i in range(k):
+        resultados.add_row([i, P[i], F[i]])
+    print(resultados)
     
-def fixed_point_iteration(f: Callable[[np.ndarray], np.ndarray], x0: np.ndarray, tol: float = 1e-6, max_iter: int = 1000) -> np.ndarray:
+def fixed_point_iteration(f: Callable[[np.ndarray], np.ndarray], x0: np.ndarray, tol: float = 1e-6, max_iter: int = 1000, inplace: bool = False) -> np.ndarray:
     """
     Performs fixed-point iteration to find the fixed point of a given function.
 
@@ -13,6 +49,7 @@ def fixed_point_iteration(f: Callable[[np.ndarray], np.ndarray], x0: np.ndarray,
     - x0 (numpy.ndarray): The initial guess for the fixed point.
     - tol (float, optional): The tolerance for convergence. Defaults to 1e-6.
     - max_iter (int, optional): The maximum number of iterations. Defaults to 1000.
+    - inplace (bool, optional): f accepts an out= keyword and writes f(x) into it, like a NumPy ufunc. Defaults to False.
 
     Returns:
     - numpy.ndarray: The estimated fixed point.
@@ -26,7 +63,7 @@ def fixed_point_iteration(f: Callable[[np.ndarray], np.ndarray], x0: np.ndarray,
     The function iterates through the following steps:
     1. Start with an initial guess x0.
     2. Compute the next guess x_new = f(x).
-    3. Repeat step 2 until the difference between x_new and x is within the specified tolerance tol, or until reaching the maximum number of iterations.
+    3. Repeat step 2 until the largest absolute difference between x_new and x is within the specified tolerance tol, or until reaching the maximum number of iterations.
 
     If the function converges within the specified tolerance, the estimated fixed point is returned.
     If the function does not converge within the maximum number of iterations, a ValueError is raised.
@@ -36,29 +73,106 @@ def fixed_point_iteration(f: Callable[[np.ndarray], np.ndarray], x0: np.ndarray,
     >>> initial_guess = np.array([1.0])  # Initial guess for the fixed point
     >>> fixed_point = fixed_point_iteration(f, initial_guess)  # Perform fixed-point iteration
     >>> fixed_point  # Display the estimated fixed point
-    array([0.73908513])
+    array([0.73908553])
+    >>> fixed_point_iteration(np.cos, initial_guess, inplace=True)  # np.cos writes into the preallocated buffer
+    array([0.73908553])
     """
-    x = np.array(x0)
+    # Two buffers hold x and x_new and swap roles every iteration; a third one holds |x_new - x|.
+    # Their dtype is promoted from x0 and the first f(x), so complex iterates keep their imaginary part.
+    x = np.asarray(x0)
+    x = x.astype(np.result_type(x, float), copy=False)
+    fx = np.asarray(f(x))
+    dtype = np.result_type(x, fx)
+    x = np.array(x, dtype=dtype)
+    x_new = np.array(fx, dtype=dtype)
+    buf = np.empty_like(x_new)
+    is_complex = np.iscomplexobj(buf)
+    tol2 = tol * tol  # Compare squared differences, no abs needed
     for i in range(max_iter):
-        x_new = np.array(f(x))
-        if np.allclose(x_new, x, atol=tol):
+        if i > 0:
+            if inplace:
+                f(x, out=x_new)
+            else:
+                x_new[...] = f(x)
+        np.subtract(x_new, x, out=buf)
+        np.multiply(buf, np.conjugate(buf) if is_complex else buf, out=buf)
+        if buf.real.max() < tol2:
             return x_new
-        x = x_new
+        x, x_new = x_new, x
+    raise ValueError("Did not converge within the maximum number of iterations.")
+
+def _as_jitted(f: Callable) -> Callable:
+    """Return f compiled in nopython mode, raising ImportError when Numba is not installed."""
+    if not _HAS_NUMBA:
+        raise ImportError("Numba is required for the compiled root-finding kernels.")
+    from numba import njit
+    from numba.extending import is_jitted
+    return f if is_jitted(f) else njit(f)
+
+@lru_cache(maxsize=32)
+def make_newton(f: Callable[[float], float], fp: Callable[[float], float]) -> Callable[[float, float, int], float]:
+    """
+    Build a Numba-compiled Newton-Raphson kernel for the pair (f, fp).
+
+    f and fp are compiled with njit (unless they already are) and captured as closure
+    variables, so Numba treats them as compile-time constants instead of dispatching
+    through a function argument. The 32 most recently used kernels are kept in memory,
+    keyed by the (f, fp) pair.
+
+    Returns:
+    - callable: kernel(p_0, TOL, N_0) returning the estimated root as a float.
+    """
+    f = _as_jitted(f)
+    fp = _as_jitted(fp)
+    from numba import njit
+
+    @njit
+    def newton(p_0, TOL, N_0):
+        for i in range(N_0):
+            fv = f(p_0)
+            if fv == 0:  # Exact root, which may also have fp(p_0) == 0
+                return p_0
+            p = p_0 - fv / fp(p_0)
+            d = p - p_0
+            if d * d < TOL * TOL:
+                return p
+            p_0 = p
+        raise ValueError("Did not converge within the maximum number of iterations.")
+
+    return newton
+
+def _newton_scalar(f: Callable[[float], float], fp: Callable[[float], float], p_0: float, TOL: float, N_0: int) -> float:
+    """Newton-Raphson on plain floats, the fallback for newton_c when the extension is not built."""
+    TOL2 = TOL * TOL
+    for i in range(N_0):
+        fv = f(p_0)
+        if fv == 0:  # Exact root, which may also have fp(p_0) == 0
+            return float(p_0)
+        p = p_0 - fv / fp(p_0)
+        d = p - p_0
+        if d * d < TOL2:
+            return float(p)
+        p_0 = p
     raise ValueError("Did not converge within the maximum number of iterations.")
 
-def Newton_Raphson(f:Callable[[float], float], fp: Callable[[float], float], p_0: float, TOL: float = 1e-6, N_0: int = 1000) -> float:
+def Newton_Raphson(f: Callable[[np.ndarray], np.ndarray], fp: Callable[[np.ndarray], np.ndarray], p_0: Union[float, np.ndarray], TOL: float = 1e-6, N_0: int = 1000, verbose: bool = False, jit: bool = False) -> Union[float, np.ndarray]:
     """
     Newton-Raphson method for finding a root of a function.
 
     Parameters:
-    - f (callable): The function for which the root is sought.
+    - f (callable): The function for which the root is sought. Must accept NumPy arrays when p_0 is an array.
     - fp (callable): The derivative of the function f.
-    - p_0 (float): Initial guess for the root.
+    - p_0 (float, complex or numpy.ndarray): Initial guess for the root, or an array of initial guesses for independent problems.
     - TOL (float, optional): Tolerance for convergence. Defaults to 1e-6.
     - N_0 (int, optional): Maximum number of iterations. Defaults to 1000.
+    - verbose (bool, optional): Print the iteration table and relative error. Defaults to False.
+    - jit (bool, optional): Solve a real scalar p_0 with the Numba kernel from make_newton. No table is printed on this path. Defaults to False.
 
     Returns:
-    - float: Estimated root of the function.
+    - float or numpy.ndarray: Estimated root of the function, with the same shape as p_0.
+
+    Raises:
+    - ValueError: If some problem does not converge within the maximum number of iterations.
 
     The Newton-Raphson method is an iterative root-finding algorithm that uses the derivative of the function to approximate the root.
 
@@ -67,43 +181,223 @@ def Newton_Raphson(f:Callable[[float], float], fp: Callable[[float], float], p_0
     2. Compute the next approximation p = p_0 - f(p_0) / f'(p_0), where f' denotes the derivative of f.
     3. Repeat step 2 until the difference between p and p_0 is within the specified tolerance TOL, or until reaching the maximum number of iterations N_0.
 
+    When p_0 is an array every problem is updated at once with array arithmetic. Problems that have
+    already converged are frozen by a boolean mask while the remaining ones keep iterating.
+    A real scalar p_0 is iterated on plain floats instead, by the compiled newton_c kernel when the optional
+    _rootfinding extension is built and by the same loop in Python otherwise.
+
     If the method converges within the specified tolerance, the estimated root is returned.
-    If the method does not converge within the maximum number of iterations, None is returned.
+    If the method does not converge within the maximum number of iterations, a ValueError is raised.
 
     Example:
     >>> f = lambda x: x**2 - 4  # Define the function f(x) = x^2 - 4
     >>> fp = lambda x: 2 * x  # Define the derivative of f
     >>> initial_guess = 3.0  # Initial guess for the root
-    >>> root = Newton_R(f, fp, initial_guess)  # Apply Newton-Raphson method
+    >>> root = Newton_Raphson(f, fp, initial_guess)  # Apply Newton-Raphson method
     >>> root  # Display the estimated root
-    2.000000000002
+    2.0
+    >>> Newton_Raphson(f, fp, np.array([3.0, -3.0]))  # Solve several problems at once
+    array([ 2., -2.])
     """
-    i = 1
-    resultados.clear_rows()  # Assuming resultados is an instance of a data structure for storing results
-    for i in range(N_0):
-        p = p_0 - f(p_0) / fp(p_0)
-        resultados.add_row([i, p, f(p)])  # Assuming resultados supports adding rows
-        if abs(p - p_0) < TOL:
-            print(resultados)  # Assuming resultados can be printed
-            print(f"ER = {abs(p - p_0) / abs(p) * 100}%")
-            return p
-        p_0 = p
+    if jit and _is_real_scalar(p_0):
+        return make_newton(f, fp)(float(p_0), TOL, N_0)
+    if _is_real_scalar(p_0) and not verbose:
+        return (newton_c or _newton_scalar)(f, fp, float(p_0), TOL, N_0)
+    p_0 = np.asarray(p_0)
+    p_0 = p_0.astype(np.result_type(p_0, float), copy=False)
+    active = np.ones_like(p_0, dtype=bool)
+    TOL2 = TOL * TOL
+    if verbose:
+        P = np.empty((N_0,) + p_0.shape, dtype=p_0.dtype)
+        F = np.empty((N_0,) + p_0.shape, dtype=p_0.dtype)
+    # Frozen problems and exact roots (f == 0, possibly with f' == 0) take a zero step; the
+    # x/0 or 0/0 they may produce is discarded by the mask.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(N_0):
+            fv = f(p_0)
+            dv = fp(p_0)
+            if verbose:
+                P[i] = p_0
+                F[i] = fv
+            step = np.where(active & (fv != 0), fv / dv, 0.0)
+            p = p_0 - step
+            active &= ~(_sq(step) < TOL2)
+            if not active.any():
+                break
+            p_0 = p
+        else:
+            raise ValueError("Did not converge within the maximum number of iterations.")
+    if verbose:
+        _print_table(P, F, i + 1)
+        print(f"ER = {np.abs(p - p_0) / np.abs(p) * 100}%")
+    return _as_result(p)
+
+def Newton_Raphson_AD(f: Callable[[Dual], Dual], p_0: Union[float, np.ndarray], TOL: float = 1e-6, N_0: int = 1000) -> Union[float, np.ndarray]:
+    """
+    Newton-Raphson method using forward-mode automatic differentiation for the derivative.
+
+    Parameters:
+    - f (callable): The function for which the root is sought. It is evaluated on Dual numbers, so it
+      must be written with arithmetic operators and the functions from numerical_methods.DualNumbers
+      (sin, cos, exp, log, ...) instead of the NumPy ones.
+    - p_0 (float or numpy.ndarray): Initial guess for the root, or an array of initial guesses for independent problems.
+    - TOL (float, optional): Tolerance for convergence. Defaults to 1e-6.
+    - N_0 (int, optional): Maximum number of iterations. Defaults to 1000.
+
+    Returns:
+    - float or numpy.ndarray: Estimated root of the function, with the same shape as p_0.
+
+    Raises:
+    - ValueError: If some problem does not converge within the maximum number of iterations.
+
+    Each iteration evaluates f once on Dual(p_0, 1), which yields f(p_0) and the exact derivative f'(p_0)
+    together. No separate derivative has to be supplied and, unlike a finite-difference derivative, there
+    is no truncation error or cancellation near the root.
+
+    Example:
+    >>> from numerical_methods.DualNumbers import cos
+    >>> f = lambda x: cos(x) - x  # Define the function f(x) = cos(x) - x
+    >>> root = Newton_Raphson_AD(f, 1.0)  # Apply Newton-Raphson method
+    >>> root  # Display the estimated root
+    0.7390851332151607
+    """
+    p_0 = np.asarray(p_0, dtype=float)
+    seed = np.ones_like(p_0)
+    active = np.ones_like(p_0, dtype=bool)
+    TOL2 = TOL * TOL
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(N_0):
+            d = f(Dual(p_0, seed))
+            step = np.where(active & (d.value != 0), d.value / d.dot, 0.0)
+            p = p_0 - step
+            active &= ~(step * step < TOL2)
+            if not active.any():
+                return _as_result(p)
+            p_0 = p
     raise ValueError("Did not converge within the maximum number of iterations.")
 
     
-def Secante(f: Callable[[float], float], p_0: float, p_1: float, TOL: float = 1e-6, N_0: int = 1000) -> float:
+def _horner_f_fp(c: np.ndarray, x: Union[float, np.ndarray]) -> tuple:
+    """Evaluate the polynomial with coefficients c (highest degree first) and its derivative at x in one pass."""
+    f = 0.0
+    fp = 0.0
+    for ci in c:
+        fp = fp * x + f
+        f = f * x + ci
+    return f, fp
+
+def Newton_Raphson_poly(coeffs: np.ndarray, p_0: Union[float, np.ndarray], TOL: float = 1e-6, N_0: int = 1000) -> Union[float, np.ndarray]:
+    """
+    Newton-Raphson method for a polynomial given by its coefficients.
+
+    Parameters:
+    - coeffs (numpy.ndarray): Polynomial coefficients, highest degree first (the np.polyval convention).
+    - p_0 (float, complex or numpy.ndarray): Initial guess for the root, or an array of initial guesses for independent problems.
+    - TOL (float, optional): Tolerance for convergence. Defaults to 1e-6.
+    - N_0 (int, optional): Maximum number of iterations. Defaults to 1000.
+
+    Returns:
+    - float or numpy.ndarray: Estimated root of the polynomial, with the same shape as p_0.
+
+    Raises:
+    - ValueError: If some problem does not converge within the maximum number of iterations.
+
+    f and f' are evaluated together by Horner's scheme in a single pass over the coefficients, so no
+    Python callable is involved. A real scalar p_0 is solved by the ahead-of-time compiled newton_poly_f8
+    kernel when it has been built with build_rootfinding.py, and otherwise by the same kernel compiled
+    with Numba on first use when Numba is installed. Arrays of initial guesses run the Horner recurrence
+    on whole arrays, with converged problems frozen by a mask as in Newton_Raphson. A complex p_0 takes
+    this path too, which is how the complex roots of a real polynomial are found.
+
+    Example:
+    >>> root = Newton_Raphson_poly(np.array([1.0, 0.0, -4.0]), 3.0)  # f(x) = x^2 - 4
+    >>> root  # Display the estimated root
+    2.0
+    >>> Newton_Raphson_poly(np.array([1.0, 0.0, 4.0]), 3j)  # f(x) = x^2 + 4 has roots +-2j
+    2j
+    """
+    c = np.ascontiguousarray(coeffs, dtype=float)
+    if _is_real_scalar(p_0):
+        if newton_poly_f8 is not None:
+            return newton_poly_f8(c, float(p_0), TOL, N_0)
+        if _HAS_NUMBA:
+            from ._rootfinding_numba import newton_poly
+            return newton_poly(c, float(p_0), TOL, N_0)
+    p_0 = np.asarray(p_0)
+    p_0 = p_0.astype(np.result_type(p_0, float), copy=False)
+    active = np.ones_like(p_0, dtype=bool)
+    TOL2 = TOL * TOL
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(N_0):
+            fv, dv = _horner_f_fp(c, p_0)
+            step = np.where(active & (fv != 0), fv / dv, 0.0)
+            p = p_0 - step
+            active &= ~(_sq(step) < TOL2)
+            if not active.any():
+                return _as_result(p)
+            p_0 = p
+    raise ValueError("Did not converge within the maximum number of iterations.")
+
+@lru_cache(maxsize=32)
+def make_secante(f: Callable[[float], float]) -> Callable[[float, float, float, int], float]:
+    """
+    Build a Numba-compiled secant kernel for f, following the same closure pattern as make_newton.
+
+    Returns:
+    - callable: kernel(p_0, p_1, TOL, N_0) returning the estimated root as a float.
+    """
+    f = _as_jitted(f)
+    from numba import njit
+
+    @njit
+    def secante(p_0, p_1, TOL, N_0):
+        q_0 = f(p_0)
+        q_1 = f(p_1)
+        for i in range(N_0):
+            if q_1 == 0:  # Exact root, which may also have p_0 == p_1
+                return p_1
+            p = p_1 - q_1 * (p_1 - p_0) / (q_1 - q_0)
+            d = p - p_1
+            if d * d < TOL * TOL:
+                return p
+            p_0, q_0, p_1, q_1 = p_1, q_1, p, f(p)
+        raise ValueError("Did not converge within the maximum number of iterations.")
+
+    return secante
+
+def _secante_scalar(f: Callable[[float], float], p_0: float, p_1: float, TOL: float, N_0: int) -> float:
+    """Secant iteration on plain floats, the fallback for secante_c when the extension is not built."""
+    TOL2 = TOL * TOL
+    q_0 = f(p_0)
+    q_1 = f(p_1)
+    for i in range(N_0):
+        if q_1 == 0:  # Exact root, which may also have p_0 == p_1
+            return float(p_1)
+        p = p_1 - q_1 * (p_1 - p_0) / (q_1 - q_0)
+        d = p - p_1
+        if d * d < TOL2:
+            return float(p)
+        p_0, q_0, p_1, q_1 = p_1, q_1, p, f(p)
+    raise ValueError("Did not converge within the maximum number of iterations.")
+
+def Secante(f: Callable[[np.ndarray], np.ndarray], p_0: Union[float, np.ndarray], p_1: Union[float, np.ndarray], TOL: float = 1e-6, N_0: int = 1000, verbose: bool = False, jit: bool = False) -> Union[float, np.ndarray]:
     """
     Secant method for finding a root of a function.
 
     Parameters:
-    - f (callable): The function for which the root is sought.
-    - p_0 (float): Initial guess for the root.
-    - p_1 (float): Second initial guess for the root.
+    - f (callable): The function for which the root is sought. Must accept NumPy arrays when p_0, p_1 are arrays.
+    - p_0 (float, complex or numpy.ndarray): Initial guess for the root.
+    - p_1 (float, complex or numpy.ndarray): Second initial guess for the root.
     - TOL (float, optional): Tolerance for convergence. Defaults to 1e-6.
     - N_0 (int, optional): Maximum number of iterations. Defaults to 1000.
+    - verbose (bool, optional): Print the iteration table and relative error. Defaults to False.
+    - jit (bool, optional): Solve real scalar guesses with the Numba kernel from make_secante. No table is printed on this path. Defaults to False.
 
     Returns:
-    - float: Estimated root of the function.
+    - float or numpy.ndarray: Estimated root of the function, with the broadcast shape of p_0 and p_1.
+
+    Raises:
+    - ValueError: If some problem does not converge within the maximum number of iterations.
 
     The secant method is an iterative root-finding algorithm that approximates the root by linearly interpolating between two points on the curve of the function.
 
@@ -112,6 +406,11 @@ def Secante(f: Callable[[float], float], p_0: float, p_1: float, TOL: float = 1e
     2. Compute the next approximation p using linear interpolation based on the function values at p_0 and p_1.
     3. Repeat step 2 until the difference between p and p_1 is within the specified tolerance TOL, or until reaching the maximum number of iterations N_0.
 
+    When the initial guesses are arrays every problem is updated at once with array arithmetic,
+    freezing the problems that have already converged. Real scalar guesses are iterated on plain floats,
+    by the compiled secante_c kernel when the optional _rootfinding extension is built and by the same
+    loop in Python otherwise.
+
     If the method converges within the specified tolerance, the estimated root is returned.
     If the method does not converge within the maximum number of iterations, a ValueError is raised.
 
@@ -121,47 +420,116 @@ def Secante(f: Callable[[float], float], p_0: float, p_1: float, TOL: float = 1e
     >>> initial_guess_2 = 4.0  # Second initial guess for the root
     >>> root = Secante(f, initial_guess_1, initial_guess_2)  # Apply Secant method
     >>> root  # Display the estimated root
-    2.000000006782
+    2.000000000006423
     """
-    resultados.clear_rows()  # Assuming resultados is an instance of a data structure for storing results
+    if jit and _is_real_scalar(p_0) and _is_real_scalar(p_1):
+        return make_secante(f)(float(p_0), float(p_1), TOL, N_0)
+    if _is_real_scalar(p_0) and _is_real_scalar(p_1) and not verbose:
+        return (secante_c or _secante_scalar)(f, float(p_0), float(p_1), TOL, N_0)
+    p_0, p_1 = np.asarray(p_0), np.asarray(p_1)
+    dtype = np.result_type(p_0, p_1, float)
+    p_0, p_1 = np.broadcast_arrays(p_0.astype(dtype, copy=False), p_1.astype(dtype, copy=False))
     q_0 = f(p_0)
     q_1 = f(p_1)
-    resultados.add_row([0, p_0, q_0])  # Assuming resultados supports adding rows
-    resultados.add_row([1, p_1, q_1])  # Assuming resultados supports adding rows
-    i = 2
-    for i in range(N_0):
-        p = p_1 - q_1 * (p_1 - p_0) / (q_1 - q_0)
-        resultados.add_row([i, p, f(p)])  # Assuming resultados supports adding rows
-        if abs(p - p_1) < TOL:
-            print(resultados)  # Assuming resultados can be printed
-            print(f"ER = {abs(p - p_1) / abs(p) * 100}%")
-            return p
-        p_0 = p_1
-        q_0 = q_1
-        p_1 = p
-        q_1 = f(p)
+    active = np.ones(p_1.shape, dtype=bool)
+    TOL2 = TOL * TOL
+    if verbose:
+        P = np.empty((N_0 + 2,) + p_1.shape, dtype=dtype)
+        F = np.empty((N_0 + 2,) + p_1.shape, dtype=dtype)
+        P[0], F[0] = p_0, q_0
+        P[1], F[1] = p_1, q_1
+    # Converged problems end up with q_1 == q_0, and exact roots (q_1 == 0, possibly with p_0 == p_1)
+    # take a zero step; the 0/0 they may produce is discarded by the mask.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(2, N_0 + 2):
+            step = np.where(active & (q_1 != 0), q_1 * (p_1 - p_0) / (q_1 - q_0), 0.0)
+            p = p_1 - step
+            active &= ~(_sq(step) < TOL2)
+            if not active.any():
+                break
+            fv = f(p)  # The only evaluation per iteration, reused for the table and the next step
+            if verbose:
+                P[i], F[i] = p, fv
+            p_0, q_0, p_1, q_1 = p_1, q_1, p, fv
+        else:
+            raise ValueError("Did not converge within the maximum number of iterations.")
+    if verbose:
+        _print_table(P, F, i)
+        print(f"ER = {np.abs(p - p_1) / np.abs(p) * 100}%")
+    return _as_result(p)
+
+@lru_cache(maxsize=32)
+def make_steffensen(f: Callable[[float], float]) -> Callable[[float, float, int], float]:
+    """
+    Build a Numba-compiled Steffensen kernel for f, following the same closure pattern as make_newton.
 
-    raise ValueError("Did not converge within the maximum number of iterations.")
+    Returns:
+    - callable: kernel(x0, tol, max_iter) returning the estimated root as a float.
+    """
+    f = _as_jitted(f)
+    from numba import njit
 
+    @njit
+    def steffensen(x, tol, max_iter):
+        x_next = f(x)
+        for i in range(max_iter):
+            x_next_next = f(x_next)
+            dx = x_next - x
+            denominator = x_next_next - 2 * x_next + x
+            if abs(denominator) > _EPS * abs(x):
+                x_new = x - dx * dx / denominator
+            else:  # Fall back to a plain fixed-point step
+                x_new = x_next
+            d = x_new - x
+            if d * d < tol * tol:
+                return x_new
+            x_next = f(x_new)
+            x = x_new
+        raise ValueError("Did not converge within the maximum number of iterations.")
+
+    return steffensen
+
+def _steffensen_scalar(f: Callable[[float], float], x: float, tol: float, max_iter: int) -> float:
+    """Steffensen iteration on plain floats, the fallback for steffensen_c when the extension is not built."""
+    tol2 = tol * tol
+    x_next = f(x)
+    for i in range(max_iter):
+        x_next_next = f(x_next)
+        dx = x_next - x
+        denominator = x_next_next - 2 * x_next + x
+        if abs(denominator) > _EPS * abs(x):
+            x_new = x - dx * dx / denominator
+        else:  # Fall back to a plain fixed-point step
+            x_new = x_next
+        d = x_new - x
+        if d * d < tol2:
+            return float(x_new)
+        x_next = f(x_new)
+        x = x_new
+    raise ValueError("Did not converge within the maximum number of iterations.")
 
-def steffensen(f: callable, x0: float, tol: float = 1e-6, max_iter: int = 100) -> float:
+def steffensen(f: Callable[[np.ndarray], np.ndarray], x0: Union[float, np.ndarray], tol: float = 1e-6, max_iter: int = 100, jit: bool = False) -> Union[float, np.ndarray]:
     """
     Steffensen's method for root finding.
 
     Parameters:
     - f (callable): The function for which the root is sought.
-    - x0 (float): Initial guess for the root.
+    - x0 (float, complex or numpy.ndarray): Initial guess for the root, or an array of initial guesses for independent problems.
     - tol (float, optional): Tolerance for convergence. Defaults to 1e-6.
     - max_iter (int, optional): Maximum number of iterations. Defaults to 100.
+    - jit (bool, optional): Run a real scalar x0 in the Numba kernel from make_steffensen. Defaults to False.
 
     Returns:
-    - float: Estimated root of the function.
+    - float or numpy.ndarray: Estimated root of the function, with the same shape as x0.
 
     Steffensen's method is an iterative root-finding algorithm that uses a combination of function evaluations to approximate the root.
 
     The function iterates through the following steps:
     1. Start with an initial guess x0.
-    2. Compute the next approximation x_new using the function evaluations.
+    2. Compute the next approximation x_new with Aitken's delta-squared formula from x, f(x) and f(f(x)).
+       Where the denominator of that formula vanishes, x_new = f(x) (a plain fixed-point step) is used instead.
+       A real scalar x0 is iterated on plain floats, by the compiled steffensen_c kernel when the optional
+       _rootfinding extension is built and by the same loop in Python otherwise.
     3. Repeat step 2 until the difference between x_new and x is within the specified tolerance tol, or until reaching the maximum number of iterations max_iter.
 
     If the method converges within the specified tolerance, the estimated root is returned.
@@ -173,19 +541,122 @@ def steffensen(f: callable, x0: float, tol: float = 1e-6, max_iter: int = 100) -
     >>> initial_guess = 3.0  # Initial guess for the root
     >>> root = steffensen(g, initial_guess)  # Apply Steffensen's method
     >>> root  # Display the estimated root
-    2.000000000000041
+    2.561552812809308
     """
-    x = x0
-    for i in range(max_iter):
-        x_next = f(x)
-        x_next_next = f(x_next)
-        denominator = x_next_next - 2 * x_next + x
-        if abs(denominator) < tol:  # Prevent division by zero
-            print("Denominator too small. Method might not converge.")
-            return None
-        x_new = x - ((x_next - x) ** 2) / denominator
-        if abs(x_new - x) < tol:
-            return x_new
-        x = x_new
+    if jit and _is_real_scalar(x0):
+        return make_steffensen(f)(float(x0), tol, max_iter)
+    if _is_real_scalar(x0):
+        return (steffensen_c or _steffensen_scalar)(f, float(x0), tol, max_iter)
+    x = np.asarray(x0)
+    x = x.astype(np.result_type(x, float), copy=False)
+    active = np.ones_like(x, dtype=bool)
+    tol2 = tol * tol
+    # Both candidate steps are computed everywhere and the mask picks one, so the
+    # 0/0 or x/0 of an unsafe denominator never reaches the result.
+    x_next = f(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(max_iter):
+            x_next_next = f(x_next)
+            dx = x_next - x
+            denominator = x_next_next - 2 * x_next + x
+            safe = np.abs(denominator) > _EPS * np.abs(x)
+            step = np.where(active, np.where(safe, dx * dx / denominator, -dx), 0.0)
+            x_new = x - step
+            active &= ~(_sq(step) < tol2)
+            if not active.any():
+                return _as_result(x_new)
+            # f always sees the full array, so functions with per-problem parameters keep working
+            x_next = f(x_new)
+            x = x_new
+
+    raise ValueError("Did not converge within the maximum number of iterations.")
+
+
+def chandrupatla(f: Callable[..., np.ndarray], a: Union[float, np.ndarray], b: Union[float, np.ndarray], tol: float = 1e-6, max_iter: int = 100, args: tuple = ()) -> Union[float, np.ndarray]:
+    """
+    Chandrupatla's bracketing method for finding a root of a function.
+
+    Parameters:
+    - f (callable): Vectorized function for which the root is sought, called as f(x, *args) with 1-D arrays.
+    - a (float or numpy.ndarray): One end of the bracket, or an array of them for independent problems.
+    - b (float or numpy.ndarray): The other end of the bracket. f(a) and f(b) must have opposite signs.
+    - tol (float, optional): Absolute tolerance for convergence. Defaults to 1e-6.
+    - max_iter (int, optional): Maximum number of iterations. Defaults to 100.
+    - args (tuple, optional): Extra arguments for f. Each one is broadcast against the brackets and compacted
+      together with them, so per-problem parameters stay aligned with x. Defaults to ().
+
+    Returns:
+    - float or numpy.ndarray: Estimated root of the function, with the broadcast shape of a, b and args.
+
+    Raises:
+    - ValueError: If some bracket does not contain a sign change, or some problem does not converge
+      within the maximum number of iterations.
+
+    Chandrupatla's method keeps a bracket [a, b] around the root and, like Brent's method, chooses at
+    every step between inverse quadratic interpolation through (a, b, c) and bisection. The choice is
+    made by a simple test on the last three points, so unlike Newton-Raphson or the secant method it
+    cannot leave the bracket and always converges.
+
+    The function iterates through the following steps:
+    1. Evaluate f at xt = a + t * (b - a), starting with t = 0.5, and replace the end of the bracket
+       with the same sign as f(xt), keeping the discarded point as c.
+    2. Stop when the bracket is smaller than the tolerance around the best point.
+    3. Otherwise take t from inverse quadratic interpolation if the points allow it, else t = 0.5.
+
+    All problems are iterated together with array arithmetic and np.where instead of Python branches.
+    Converged problems are removed from the working arrays, so f is only evaluated at the ones still active;
+    f(x, *args)[i] must therefore depend only on x[i] and args[k][i].
+
+    Example:
+    >>> f = lambda x: x**2 - 4  # Define the function f(x) = x^2 - 4
+    >>> root = chandrupatla(f, 0.0, 5.0)  # Apply Chandrupatla's method on the bracket [0, 5]
+    >>> root  # Display the estimated root
+    2.0
+    >>> chandrupatla(f, np.array([0.0, -5.0]), np.array([5.0, 0.0]))  # Solve several brackets at once
+    array([ 2., -2.])
+    >>> chandrupatla(lambda x, k: x**2 - k, 0.0, 5.0, args=(np.array([4.0, 9.0, 16.0]),))  # One bracket per k
+    array([2., 3., 4.])
+    """
+    a, b, *args = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float), *args)
+    shape = a.shape
+    if a.size == 0:  # Nothing to solve; the loop below would never see every problem converge
+        return np.empty(shape)
+    a, b = a.ravel(), b.ravel()
+    args = tuple(arg.ravel() for arg in args)
+    fa = np.asarray(f(a, *args), dtype=float)
+    fb = np.asarray(f(b, *args), dtype=float)
+    if np.any(np.sign(fa) * np.sign(fb) > 0):
+        raise ValueError("f(a) and f(b) must have opposite signs.")
+    c, fc = a, fa
+    t = np.full_like(a, 0.5)
+    root = np.empty_like(a)
+    idx = np.arange(a.size)  # Position in root of every problem still in the working arrays
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(max_iter):
+            xt = a + t * (b - a)
+            ft = np.asarray(f(xt, *args), dtype=float)
+            same = np.sign(ft) == np.sign(fa)
+            c, fc = np.where(same, a, b), np.where(same, fa, fb)
+            b, fb = np.where(same, b, a), np.where(same, fb, fa)
+            a, fa = xt, ft
+
+            use_a = np.abs(fa) < np.abs(fb)
+            xm = np.where(use_a, a, b)
+            fm = np.where(use_a, fa, fb)
+            tlim = (2 * _EPS * np.abs(xm) + tol) / np.abs(b - c)
+            done = (fm == 0) | (tlim > 0.5)
+            if done.any():
+                root[idx[done]] = xm[done]
+                keep = ~done
+                if not keep.any():
+                    return _as_result(root.reshape(shape))
+                a, b, c, fa, fb, fc, tlim, idx = (x[keep] for x in (a, b, c, fa, fb, fc, tlim, idx))
+                args = tuple(arg[keep] for arg in args)
+
+            xi = (a - b) / (c - b)
+            phi = (fa - fb) / (fc - fb)
+            iqi = (phi * phi < xi) & ((1 - phi) * (1 - phi) < 1 - xi)
+            t = np.where(iqi, fa / (fb - fa) * fc / (fb - fc) + (c - a) / (b - a) * fa / (fc - fa) * fb / (fc - fb), 0.5)
+            t = np.minimum(1 - tlim, np.maximum(tlim, t))
 
     raise ValueError("Did not converge within the maximum number of iterations.")
@@ -0,0 +1,129 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled scalar kernels for the root-finding methods in Rootfinding.
+
+Build in place with:
+    cythonize -i numerical_methods/_rootfinding.pyx
+
+Every kernel keeps its state in C doubles and only calls back into Python for f (and fp).
+When the functions are ctypes function pointers with signature double(double), e.g. loaded
+from a shared library, the whole loop runs in C without the GIL.
+"""
+import ctypes
+
+from libc.float cimport DBL_EPSILON
+from libc.math cimport fabs
+from libc.stdint cimport uintptr_t
+
+ctypedef double (*scalar_func)(double) noexcept nogil
+
+
+cdef scalar_func _c_pointer(object f):
+    """Return the C address behind a ctypes double(double) function pointer, or NULL."""
+    if (isinstance(f, ctypes._CFuncPtr)
+            and f.restype is ctypes.c_double
+            and tuple(f.argtypes or ()) == (ctypes.c_double,)):
+        return <scalar_func><uintptr_t>ctypes.cast(f, ctypes.c_void_p).value
+    return NULL
+
+
+cpdef double newton_c(object f, object fp, double p0, double tol, Py_ssize_t N) except? -1:
+    """Newton-Raphson iteration, see Rootfinding.Newton_Raphson."""
+    cdef scalar_func cf = _c_pointer(f)
+    cdef scalar_func cfp = _c_pointer(fp)
+    cdef double p, d, fv
+    cdef double tol2 = tol * tol
+    cdef Py_ssize_t i
+    if cf != NULL and cfp != NULL:
+        with nogil:
+            for i in range(N):
+                fv = cf(p0)
+                if fv == 0:  # Exact root, cdivision would turn a 0/0 here into NaN
+                    return p0
+                p = p0 - fv / cfp(p0)
+                d = p - p0
+                if d * d < tol2:
+                    return p
+                p0 = p
+    else:
+        for i in range(N):
+            fv = f(p0)
+            if fv == 0:
+                return p0
+            p = p0 - fv / <double>fp(p0)
+            d = p - p0
+            if d * d < tol2:
+                return p
+            p0 = p
+    raise ValueError("Did not converge within the maximum number of iterations.")
+
+
+cpdef double secante_c(object f, double p0, double p1, double tol, Py_ssize_t N) except? -1:
+    """Secant iteration, see Rootfinding.Secante."""
+    cdef scalar_func cf = _c_pointer(f)
+    cdef double p, q0, q1, d
+    cdef double tol2 = tol * tol
+    cdef Py_ssize_t i
+    if cf != NULL:
+        with nogil:
+            q0 = cf(p0)
+            q1 = cf(p1)
+            for i in range(N):
+                if q1 == 0:  # Exact root, cdivision would turn a 0/0 here into NaN
+                    return p1
+                p = p1 - q1 * (p1 - p0) / (q1 - q0)
+                d = p - p1
+                if d * d < tol2:
+                    return p
+                p0, q0, p1, q1 = p1, q1, p, cf(p)
+    else:
+        q0 = f(p0)
+        q1 = f(p1)
+        for i in range(N):
+            if q1 == 0:
+                return p1
+            p = p1 - q1 * (p1 - p0) / (q1 - q0)
+            d = p - p1
+            if d * d < tol2:
+                return p
+            p0, q0, p1, q1 = p1, q1, p, <double>f(p)
+    raise ValueError("Did not converge within the maximum number of iterations.")
+
+
+cdef inline double _aitken(double x, double x_next, double x_next_next) noexcept nogil:
+    """Aitken's delta-squared update, falling back to x_next when the denominator vanishes."""
+    cdef double dx = x_next - x
+    cdef double denominator = x_next_next - 2 * x_next + x
+    if fabs(denominator) > DBL_EPSILON * fabs(x):
+        return x - dx * dx / denominator
+    return x_next
+
+
+cpdef double steffensen_c(object f, double x, double tol, Py_ssize_t max_iter) except? -1:
+    """Steffensen iteration, see Rootfinding.steffensen."""
+    cdef scalar_func cf = _c_pointer(f)
+    cdef double x_next, x_next_next, x_new, d
+    cdef double tol2 = tol * tol
+    cdef Py_ssize_t i
+    if cf != NULL:
+        with nogil:
+            x_next = cf(x)
+            for i in range(max_iter):
+                x_next_next = cf(x_next)
+                x_new = _aitken(x, x_next, x_next_next)
+                d = x_new - x
+                if d * d < tol2:
+                    return x_new
+                x_next = cf(x_new)
+                x = x_new
+    else:
+        x_next = f(x)
+        for i in range(max_iter):
+            x_next_next = f(x_next)
+            x_new = _aitken(x, x_next, x_next_next)
+            d = x_new - x
+            if d * d < tol2:
+                return x_new
+            x_next = f(x_new)
+            x = x_new
+    raise ValueError("Did not converge within the maximum number of iterations.")
@@ -0,0 +1,26 @@
+"""
+Numba kernels for the root finders whose function is plain data rather than a callable.
+
+Importing this module imports Numba, so Rootfinding only imports it on first use.
+build_rootfinding.py compiles the same kernels ahead of time.
+"""
+from numba import njit
+
+from .Rootfinding import _horner_f_fp
+
+_horner_f_fp_jit = njit(cache=True)(_horner_f_fp)
+
+
+@njit(cache=True)
+def newton_poly(c, p_0, TOL, N_0):
+    """Newton-Raphson iteration on the polynomial with coefficients c, see Rootfinding.Newton_Raphson_poly."""
+    for i in range(N_0):
+        f, fp = _horner_f_fp_jit(c, p_0)
+        if f == 0:  # Exact root, which may also have fp == 0
+            return p_0
+        p = p_0 - f / fp
+        d = p - p_0
+        if d * d < TOL * TOL:
+            return p
+        p_0 = p
+    raise ValueError("Did not converge within the maximum number of iterations.")
@@ -0,0 +1,25 @@
+"""
+Ahead-of-time compilation of the polynomial root-finding kernel with Numba.
+
+Run from the repository root:
+    python -m numerical_methods.build_rootfinding
+
+This writes the rootfinding_aot extension next to Rootfinding.py. Once it exists,
+Newton_Raphson_poly uses it for scalar problems without any JIT warmup.
+User callables cannot cross an AOT-compiled signature, so only kernels whose
+function is plain data (polynomial coefficients) are exported here; generic callables
+use the Cython kernels in _rootfinding.pyx or the jit=True paths instead.
+"""
+import os
+
+from numba.pycc import CC
+
+from ._rootfinding_numba import newton_poly
+
+cc = CC("rootfinding_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("newton_poly_f8", "f8(f8[:], f8, f8, i8)")(newton_poly.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()